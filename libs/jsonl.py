@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Shared helpers for reading JSONL artifacts, using orjson when it is installed."""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson returns integers outside the int64/uint64 range as floats instead of
+# raising, so lines with digit runs that long are decoded by json.loads.
+_LONG_DIGIT_RUN_RE = re.compile(rb"\d{19,}")
+
+
+def decode_json_line(line: bytes) -> Any:
+    """Decode one JSON document, matching ``json.loads`` whether or not orjson is present."""
+    if orjson is not None and not _LONG_DIGIT_RUN_RE.search(line):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity and out-of-range floats are valid for json.loads.
+            pass
+    return json.loads(line)
+
+
+def read_jsonl(path: Path) -> list[dict[str, Any]]:
+    """Read a JSONL file in one call and return its object rows, skipping blank lines."""
+    records: list[dict[str, Any]] = []
+    for line in path.read_bytes().split(b"\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        payload = decode_json_line(stripped)
+        if isinstance(payload, dict):
+            records.append(payload)
+    return records
@@ -1,9 +1,29 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 from typing import Any, Iterable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson returns integers outside the int64/uint64 range as floats instead of
+# raising, so lines with digit runs that long are decoded by json.loads.
+_LONG_DIGIT_RUN_RE = re.compile(rb"\d{19,}")
+
+
+def _decode_json_line(line: bytes) -> Any:
+    if orjson is not None and not _LONG_DIGIT_RUN_RE.search(line):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # NaN, Infinity and out-of-range floats are valid for json.loads.
+            pass
+    return json.loads(line)
+
 
 def _iter_artifact_specs(ctx: Any, kind: str) -> Iterable[dict[str, Any]]:
     attrs = (
@@ -74,11 +94,11 @@ def read_jsonl(ctx: Any, name: str, *, family: str | None = None) -> list[dict[s
     if not path.exists():
         return []
     rows: list[dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
+    for raw in path.read_bytes().split(b"\n"):
         line = raw.strip()
         if not line:
             continue
-        payload = json.loads(line)
+        payload = _decode_json_line(line)
         if isinstance(payload, dict):
             rows.append(payload)
     return rows
@@ -113,9 +133,8 @@ def write_jsonl_artifact(
 ) -> Path:
     out_path = resolve_output_path(ctx, default_name=name, family=family)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", encoding="utf-8") as fh:
-        for row in rows:
-            fh.write(json.dumps(row, ensure_ascii=False) + "\n")
+    payload = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+    out_path.write_text(payload, encoding="utf-8")
     return out_path
 
 
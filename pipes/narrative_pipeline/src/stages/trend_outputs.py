@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import csv
+import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -21,19 +23,18 @@ def _safe_get(payload: dict[str, Any], *path: str) -> float | None:
 
 def _load_history(history_root: Path) -> list[dict[str, Any]]:
     rows: list[dict[str, Any]] = []
-    if not history_root.exists():
+    if not history_root.is_dir():
         return rows
-    for candidate in history_root.iterdir():
-        if not candidate.is_dir():
-            continue
-        bundle_path = candidate / "diagnostics" / "diagnostics_bundle.json"
-        if not bundle_path.exists():
-            continue
-        import json
-
-        payload = json.loads(bundle_path.read_text(encoding="utf-8"))
-        if isinstance(payload, dict):
-            rows.append(payload)
+    with os.scandir(history_root) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            bundle_path = Path(entry.path) / "diagnostics" / "diagnostics_bundle.json"
+            if not bundle_path.exists():
+                continue
+            payload = json.loads(bundle_path.read_text(encoding="utf-8"))
+            if isinstance(payload, dict):
+                rows.append(payload)
     rows.sort(
         key=lambda row: (
             str(row.get("run", {}).get("created_at", "")),
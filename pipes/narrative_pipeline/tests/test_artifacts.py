@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.stages import _artifacts
+from src.stages._artifacts import read_jsonl
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_read_jsonl_keeps_big_ints_and_accepts_nan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(_artifacts, "orjson", None)
+    path = tmp_path / "rows.jsonl"
+    path.write_text(
+        '{"big": 18446744073709551616}\n'
+        "\n"
+        '{"neg": -9223372036854775809}\n'
+        '{"score": NaN}\n',
+        encoding="utf-8",
+    )
+
+    rows = read_jsonl(SimpleNamespace(inputs=[str(path)]), "rows.jsonl")
+
+    assert rows[0]["big"] == 18446744073709551616
+    assert isinstance(rows[0]["big"], int)
+    assert rows[1]["neg"] == -9223372036854775809
+    assert math.isnan(rows[2]["score"])
@@ -1,2 +1,17 @@
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
+
+def _append_repo_root_for_shared_libs() -> None:
+    current = Path(__file__).resolve()
+    for parent in current.parents:
+        if (parent / "libs" / "__init__.py").exists():
+            sys.path.append(str(parent))
+            return
+
+
+# Ensure repository-level shared libs (libs/local_llm.py, libs/jsonl.py) are
+# importable by the modules in this package.
+_append_repo_root_for_shared_libs()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from libs.jsonl import decode_json_line
+
+
+def iter_jsonl(path: Path, *, stop_on_error: bool = False) -> Iterator[dict[str, Any]]:
+    """Yield object rows from a JSONL file.
+
+    The file is read in one call and split on raw newline bytes, so each line is
+    handed to the decoder (orjson when installed) without an intermediate text
+    decode of the whole file. Blank lines and non-object payloads are skipped.
+    With ``stop_on_error`` the iteration ends at the first undecodable line
+    (used for resumable outputs whose tail may have been truncated mid-write).
+    """
+
+    for raw in path.read_bytes().split(b"\n"):
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            payload = decode_json_line(line)
+        except ValueError:
+            if stop_on_error:
+                return
+            raise
+        if isinstance(payload, dict):
+            yield payload
+
+
+def read_jsonl(path: Path, *, stop_on_error: bool = False) -> list[dict[str, Any]]:
+    return list(iter_jsonl(path, stop_on_error=stop_on_error))
+
+
+def write_jsonl(path: Path, rows: Iterable[dict[str, Any]]) -> None:
+    """Serialize all rows up front and write the file in a single call."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+    path.write_text(payload, encoding="utf-8")
@@ -1,21 +1,7 @@
 from __future__ import annotations
 
-import sys
-from pathlib import Path
-
-
-def _append_repo_root_for_shared_libs() -> None:
-    current = Path(__file__).resolve()
-    for parent in current.parents:
-        if (parent / "libs" / "local_llm.py").exists():
-            sys.path.append(str(parent))
-            return
-
-
-# Ensure repository-level shared libs (libs/local_llm.py) are importable at runtime.
-_append_repo_root_for_shared_libs()
-
-from libs.local_llm import (  # noqa: E402
+# The package __init__ puts the repository root on sys.path for shared libs.
+from libs.local_llm import (
     DEFAULT_LM_STUDIO_CHAT_COMPLETIONS_URL,
     request_chat_completion_content,
     request_chat_completion_content_streaming,
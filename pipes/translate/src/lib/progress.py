@@ -19,6 +19,8 @@ class ProgressBar:
         self.color = color
         self.start = time.monotonic()
         self._last_render_len = 0
+        # The label never changes, so colorize it once rather than per render.
+        self._label_text = f"{self.COLOR_CYAN}{label}{self.COLOR_RESET}" if color else label
 
     @staticmethod
     def _format_seconds(seconds: float) -> str:
@@ -43,9 +45,7 @@ class ProgressBar:
         else:
             eta = "--:--"
 
-        label = self.label
         if self.color:
-            label = f"{self.COLOR_CYAN}{label}{self.COLOR_RESET}"
             bar = f"{self.COLOR_GREEN}{bar}{self.COLOR_RESET}"
 
         status = f"{completed}/{self.total}"
@@ -54,7 +54,7 @@ class ProgressBar:
             reset = self.COLOR_RESET if self.color else ""
             status += f" | {status_color}failed: {failed}{reset}"
 
-        return f"\r{label} [{bar}] {completed}/{self.total} ({ratio * 100:5.1f}%) ETA {eta} [{status}]"
+        return f"\r{self._label_text} [{bar}] {completed}/{self.total} ({ratio * 100:5.1f}%) ETA {eta} [{status}]"
 
     def print(self, completed: int, failed: int = 0) -> None:
         msg = self.render(completed, failed=failed)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from ..lib.jsonl import read_jsonl, write_jsonl
+
 SOURCE_PATTERN = "pass2_pre/{lang}/paragraphs.jsonl"
 CANDIDATE_PATTERN = "final/{lang}/candidate.md"
 MAP_PATTERN = "final/{lang}/candidate_map.jsonl"
@@ -76,16 +77,7 @@ def _load_rows(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"candidate_assembly input artifact missing: {path}")
 
-    rows: list[dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if not isinstance(payload, dict):
-            continue
-        rows.append(payload)
-    return rows
+    return read_jsonl(path)
 
 
 def _paragraph_text(row: dict[str, Any]) -> str:
@@ -151,12 +143,9 @@ def run_whole(ctx) -> None:
             candidate_lines.append("")
 
     candidate_path.parent.mkdir(parents=True, exist_ok=True)
-    map_path.parent.mkdir(parents=True, exist_ok=True)
 
     candidate_path.write_text("\n".join(candidate_lines), encoding="utf-8")
-    with map_path.open("w", encoding="utf-8") as output_file:
-        for map_row in map_rows:
-            output_file.write(json.dumps(map_row, ensure_ascii=False) + "\n")
+    write_jsonl(map_path, map_rows)
 
 
 def run_item(ctx, item: dict[str, object]) -> None:
@@ -4,6 +4,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from ..lib.jsonl import read_jsonl, write_jsonl
+
 
 TYPOGRAPHY_INPUT_PATTERN = "review/{lang}/typography/review.json"
 CRITICS_INPUT_PATTERN = "review/{lang}/critics/review.json"
@@ -119,17 +121,9 @@ def _load_json(path: Path) -> dict[str, Any]:
 
 
 def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
     if not path.exists():
-        return rows
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
+        return []
+    return read_jsonl(path)
 
 
 def _paragraph_ids_from_candidate_map(path: Path) -> list[str]:
@@ -151,13 +145,6 @@ def _paragraph_ids_from_typography_rows(language: str) -> list[str]:
     return ids
 
 
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as output_file:
-        for row in rows:
-            output_file.write(json.dumps(row, ensure_ascii=False) + "\n")
-
-
 def _normalize_typography_rows(typography_payload: dict[str, Any]) -> dict[str, dict[str, Any]]:
     rows: dict[str, dict[str, Any]] = {}
     paragraph_reviews = typography_payload.get("paragraph_reviews")
@@ -279,8 +266,8 @@ def run_whole(ctx) -> None:
             }
         )
 
-    _write_jsonl(typography_rows_path, normalized_typography_rows)
-    _write_jsonl(critics_rows_path, normalized_critics_rows)
+    write_jsonl(typography_rows_path, normalized_typography_rows)
+    write_jsonl(critics_rows_path, normalized_critics_rows)
 
 
 def run_item(ctx, item: dict[str, object]) -> None:
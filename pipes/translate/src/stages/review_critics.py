@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from ..lib.jsonl import read_jsonl, write_jsonl
 from ..lib.local_llm_client import DEFAULT_CHAT_COMPLETIONS_URL, chat_completion
 from ..lib.progress import ProgressBar
 
@@ -115,21 +117,26 @@ def _stage_config(ctx) -> dict[str, object]:
 def _resolve_critics_dir(configured_path: str | None) -> Path:
     if configured_path:
         explicit = Path(configured_path)
-        if explicit.exists() and explicit.is_dir():
+        if explicit.is_dir():
             return explicit
 
     scope_roots = [Path.cwd(), Path(__file__).resolve().parents[3], Path(__file__).resolve().parents[4]]
     for scope in scope_roots:
         candidate = scope / DEFAULT_CRITICS_DIR
-        if candidate.exists() and candidate.is_dir():
+        if candidate.is_dir():
             return candidate
     return DEFAULT_CRITICS_DIR
 
 
 def _load_critic_files(critics_dir: Path) -> list[Path]:
-    if not critics_dir.exists() or not critics_dir.is_dir():
+    if not critics_dir.is_dir():
         return []
-    return sorted(path for path in critics_dir.iterdir() if path.is_file() and path.suffix.lower() == ".md")
+    with os.scandir(critics_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() == ".md" and entry.is_file()
+        )
 
 
 def _extract_json_object(raw: str) -> dict[str, Any]:
@@ -303,24 +310,9 @@ def _load_json(path: Path) -> dict[str, Any]:
 
 
 def _load_jsonl(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
     if not path.exists():
-        return rows
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
-
-
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as output_file:
-        for row in rows:
-            output_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        return []
+    return read_jsonl(path)
 
 
 def run_whole(ctx) -> None:
@@ -523,8 +515,8 @@ def run_whole(ctx) -> None:
             }
         )
 
-    _write_jsonl(Path(TYPOGRAPHY_ROWS_PATTERN.format(lang=language)), typography_rows)
-    _write_jsonl(Path(CRITICS_ROWS_PATTERN.format(lang=language)), critics_rows)
+    write_jsonl(Path(TYPOGRAPHY_ROWS_PATTERN.format(lang=language)), typography_rows)
+    write_jsonl(Path(CRITICS_ROWS_PATTERN.format(lang=language)), critics_rows)
 
 
 def run_item(ctx, item: dict[str, object]) -> None:
@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from ..lib.jsonl import iter_jsonl, read_jsonl, write_jsonl
 from ..lib.local_llm_client import (
     DEFAULT_CHAT_COMPLETIONS_URL,
     chat_completion,
@@ -148,17 +149,17 @@ def _candidate_prompt_paths(prompt_root: Path) -> list[Path]:
 def _resolve_prompt_path(configured_path: str | None) -> Path:
     if configured_path:
         explicit = Path(configured_path)
-        if explicit.exists() and explicit.is_file():
+        if explicit.is_file():
             return explicit
 
     scope_roots = [Path.cwd(), Path(__file__).resolve().parents[3], Path(__file__).resolve().parents[4]]
     for root in DEFAULT_PROMPT_ROOTS:
         expanded_roots = [root] if root.is_absolute() else [scope / root for scope in scope_roots]
         for expanded_root in expanded_roots:
-            if not expanded_root.exists() or not expanded_root.is_dir():
+            if not expanded_root.is_dir():
                 continue
             for candidate in _candidate_prompt_paths(expanded_root):
-                if candidate.exists() and candidate.is_file():
+                if candidate.is_file():
                     return candidate
 
     checked = ", ".join(str(root) for root in DEFAULT_PROMPT_ROOTS)
@@ -169,39 +170,23 @@ def _load_rows(path: Path, *, label: str) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"review_typography {label} input artifact missing: {path}")
 
-    rows: list[dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
+    return read_jsonl(path)
 
 
-def _load_jsonl_prefix(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+def _load_rows_by_id(path: Path, *, label: str) -> dict[str, dict[str, Any]]:
     if not path.exists():
-        return rows
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            break
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
+        raise FileNotFoundError(f"review_typography {label} input artifact missing: {path}")
 
+    rows_by_id: dict[str, dict[str, Any]] = {}
+    for idx, row in enumerate(iter_jsonl(path), start=1):
+        rows_by_id[_row_id(row, idx)] = row
+    return rows_by_id
 
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as output_file:
-        for row in rows:
-            output_file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+def _load_jsonl_prefix(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    return read_jsonl(path, stop_on_error=True)
 
 
 def _row_id(row: dict[str, Any], index: int) -> str:
@@ -449,15 +434,11 @@ def run_whole(ctx) -> None:
     concurrency = max(1, int(cfg.get("concurrency", 1)))
 
     source_path, translated_path = _resolve_input_artifact_paths(ctx, language)
-    source_rows = _load_rows(source_path, label="source")
+    source_by_id = _load_rows_by_id(source_path, label="source")
     translated_rows = _load_rows(translated_path, label="translated")
     output_path = Path(TARGET_PATTERN.format(lang=language))
     review_path = Path(REVIEW_OUTPUT_PATTERN.format(lang=language))
 
-    source_by_id: dict[str, dict[str, Any]] = {}
-    for idx, source_row in enumerate(source_rows, start=1):
-        source_by_id[_row_id(source_row, idx)] = source_row
-
     def process_row(index_and_row: tuple[int, dict[str, Any]]) -> tuple[int, dict[str, Any], dict[str, Any]]:
         idx, translated_row = index_and_row
         paragraph_id = _row_id(translated_row, idx)
@@ -487,7 +468,8 @@ def run_whole(ctx) -> None:
         if decision in {"minor_rewrite", "major_rewrite"}:
             final_translation = revised_translation or translated_text
 
-        out_row = dict(translated_row)
+        # Rows come fresh from _load_rows and are not reused, so update in place.
+        out_row = translated_row
         out_row["paragraph_id"] = paragraph_id
         out_row["item_id"] = str(translated_row.get("item_id") or paragraph_id)
         out_row["source_text"] = source_text
@@ -530,7 +512,7 @@ def run_whole(ctx) -> None:
         resume_from += 1
 
     if resume_from != len(existing_output_rows):
-        _write_jsonl(output_path, existing_output_rows[:resume_from])
+        write_jsonl(output_path, existing_output_rows[:resume_from])
         existing_output_rows = existing_output_rows[:resume_from]
     if resume_from != len(existing_review_rows):
         existing_review_rows = existing_review_rows[:resume_from]
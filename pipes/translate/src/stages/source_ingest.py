@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
+from ..lib.jsonl import write_jsonl
+
 
 @dataclass(frozen=True)
 class Paragraph:
@@ -24,8 +26,10 @@ def _sha256_text(payload: str) -> str:
 
 
 def _split_markdown_paragraphs(markdown: str) -> Iterable[str]:
-    blocks = [part.strip() for part in markdown.replace("\r\n", "\n").split("\n\n")]
-    return [block for block in blocks if block]
+    for part in markdown.replace("\r\n", "\n").split("\n\n"):
+        block = part.strip()
+        if block:
+            yield block
 
 
 def _resolve_markdown_input(ctx) -> Path:
@@ -75,13 +79,18 @@ def _resolve_markdown_input(ctx) -> Path:
 
 def _build_paragraph_rows(markdown_text: str) -> list[Paragraph]:
     rows: list[Paragraph] = []
+    # Scene breaks and other repeated blocks share a digest; hash each once.
+    hashes: dict[str, str] = {}
     for index, paragraph_text in enumerate(_split_markdown_paragraphs(markdown_text), start=1):
         paragraph_id = f"p-{index:04d}"
+        content_hash = hashes.get(paragraph_text)
+        if content_hash is None:
+            content_hash = hashes[paragraph_text] = _sha256_text(paragraph_text)
         rows.append(
             Paragraph(
                 paragraph_id=paragraph_id,
                 text=paragraph_text,
-                content_hash=_sha256_text(paragraph_text),
+                content_hash=content_hash,
             )
         )
     return rows
@@ -102,22 +111,18 @@ def run_whole(ctx) -> None:
     paragraphs_path = Path("paragraphs.jsonl")
     manifest_path = Path("manifest.json")
 
-    paragraphs_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with paragraphs_path.open("w", encoding="utf-8") as paragraphs_file:
-        for row in paragraph_rows:
-            paragraphs_file.write(
-                json.dumps(
-                    {
-                        "item_id": row.paragraph_id,
-                        "paragraph_id": row.paragraph_id,
-                        "text": row.text,
-                        "content_hash": row.content_hash,
-                    },
-                    ensure_ascii=False,
-                )
-                + "\n"
-            )
+    write_jsonl(
+        paragraphs_path,
+        (
+            {
+                "item_id": row.paragraph_id,
+                "paragraph_id": row.paragraph_id,
+                "text": row.text,
+                "content_hash": row.content_hash,
+            }
+            for row in paragraph_rows
+        ),
+    )
 
     inputs_ref = {
         "name": "input_markdown",
@@ -162,14 +167,14 @@ def run_whole(ctx) -> None:
             }
         ],
     }
-    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-
-    manifest_data = json.loads(manifest_path.read_text(encoding="utf-8"))
-    manifest_data["stage_outputs"][0]["outputs"].append(
+    # The manifest records the hash of its own pre-append serialization; hash
+    # that in memory instead of writing and re-reading the file.
+    manifest_bytes = (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    outputs.append(
         {
             "name": "run_manifest",
             "path": str(manifest_path),
-            "hash": _sha256_bytes(manifest_path.read_bytes()),
+            "hash": _sha256_bytes(manifest_bytes),
             "schema_version": "phase1-v0",
             "produced_by": {
                 "run_id": run_id,
@@ -178,4 +183,4 @@ def run_whole(ctx) -> None:
             },
         }
     )
-    manifest_path.write_text(json.dumps(manifest_data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
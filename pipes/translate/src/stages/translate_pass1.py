@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from ..lib.jsonl import read_jsonl, write_jsonl
 from ..lib.local_llm_client import (
     DEFAULT_CHAT_COMPLETIONS_URL,
     chat_completion_streaming,
@@ -133,10 +134,10 @@ def _resolve_prompt_path(language: str, prompt_root: str | None) -> Path:
         expanded_roots = [root] if root.is_absolute() else [scope_root / root for scope_root in scope_roots]
         for expanded_root in expanded_roots:
             checked_roots.append(expanded_root)
-            if not expanded_root.exists() or not expanded_root.is_dir():
+            if not expanded_root.is_dir():
                 continue
             for candidate in _candidate_prompt_paths(expanded_root, language):
-                if candidate.exists() and candidate.is_file():
+                if candidate.is_file():
                     return candidate
 
     roots_display = ", ".join(str(root) for root in checked_roots)
@@ -189,33 +190,13 @@ def _load_paragraph_rows(path: Path) -> list[dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"translate_pass1 input artifact missing: {path}")
 
-    rows: list[dict[str, Any]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        payload = json.loads(line)
-        if not isinstance(payload, dict):
-            continue
-        rows.append(payload)
-    return rows
+    return read_jsonl(path)
 
 
 def _load_jsonl_prefix(path: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
     if not path.exists():
-        return rows
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            break
-        if isinstance(payload, dict):
-            rows.append(payload)
-    return rows
+        return []
+    return read_jsonl(path, stop_on_error=True)
 
 
 def _row_identity(row: dict[str, Any], index: int) -> str:
@@ -225,13 +206,6 @@ def _row_identity(row: dict[str, Any], index: int) -> str:
     return f"row-{index:05d}"
 
 
-def _write_jsonl(path: Path, rows: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as output_file:
-        for row in rows:
-            output_file.write(json.dumps(row, ensure_ascii=False) + "\n")
-
-
 def _translate_row(
     row: dict[str, Any],
     *,
@@ -339,7 +313,7 @@ def run_whole(ctx) -> None:
             break
         resume_from += 1
     if resume_from != len(existing_rows):
-        _write_jsonl(output_artifact_path, existing_rows[:resume_from])
+        write_jsonl(output_artifact_path, existing_rows[:resume_from])
         existing_rows = existing_rows[:resume_from]
 
     failed_count = sum(1 for row in existing_rows if row.get("error"))
@@ -15,6 +15,7 @@ import uuid
 from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Iterable
 
 import nltk
@@ -80,7 +81,7 @@ def build_filtered_token_index(manuscript_tokens: dict) -> list[dict]:
                     "global_index": token["global_index"],
                 }
             )
-    filtered_tokens.sort(key=lambda item: item["global_index"])
+    filtered_tokens.sort(key=itemgetter("global_index"))
     return filtered_tokens
 
 
@@ -9,6 +9,7 @@ sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 import argparse
 import json
+import os
 from datetime import datetime, timezone
 
 from libs.local_llm import (
@@ -67,16 +68,21 @@ def call_lm(base_url: str, model: str, system_prompt: str, manuscript_text: str,
 
 
 def gather_critic_files(critics_dir: Path) -> list[Path]:
-    if not critics_dir.exists() or not critics_dir.is_dir():
+    if not critics_dir.is_dir():
         raise SystemExit(f"Critics directory not found: {critics_dir}")
-    critics = sorted(p for p in critics_dir.iterdir() if p.suffix.lower() == ".md" and p.is_file())
+    with os.scandir(critics_dir) as entries:
+        critics = sorted(
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() == ".md" and entry.is_file()
+        )
     if not critics:
         raise SystemExit(f"No markdown critics found in: {critics_dir}")
     return critics
 
 
 def load_manuscript(manuscript_path: Path) -> str:
-    if not manuscript_path.exists() or not manuscript_path.is_file():
+    if not manuscript_path.is_file():
         raise SystemExit(f"Manuscript file not found: {manuscript_path}")
     if manuscript_path.suffix.lower() != ".md":
         raise SystemExit(f"Manuscript must be a markdown file (.md): {manuscript_path}")
@@ -21,6 +21,7 @@ import math
 import re
 from collections import Counter
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Iterable, List, Sequence
@@ -90,7 +91,7 @@ def build_filtered_token_index(manuscript_tokens: dict) -> list[dict]:
                     "global_index": token["global_index"],
                 }
             )
-    filtered_tokens.sort(key=lambda item: item["global_index"])
+    filtered_tokens.sort(key=itemgetter("global_index"))
     return filtered_tokens
 
 
@@ -28,6 +28,7 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
+from libs.jsonl import read_jsonl
 from libs.local_llm import request_chat_completion_content
 
 TOKEN_PATTERN = re.compile(r"[A-Za-z']+")
@@ -168,19 +169,6 @@ def tokenize(text: str) -> list[str]:
     return [token.lower() for token in TOKEN_PATTERN.findall(text)]
 
 
-def read_jsonl(path: Path) -> list[dict[str, Any]]:
-    records: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            payload = json.loads(stripped)
-            if isinstance(payload, dict):
-                records.append(payload)
-    return records
-
-
 def load_overused_words(path: Path, max_words: int) -> list[str]:
     payload = json.loads(path.read_text(encoding="utf-8"))
 
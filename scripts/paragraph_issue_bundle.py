@@ -2,12 +2,18 @@
 """Aggregate paragraph text and detector issues into a unified bundle artifact."""
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
 import argparse
 import json
 from datetime import datetime, timezone
-from pathlib import Path
 from typing import Any, Dict, List
 
+from libs.jsonl import read_jsonl
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -41,19 +47,6 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _read_jsonl(path: Path) -> List[Dict[str, Any]]:
-    records: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            payload = json.loads(stripped)
-            if isinstance(payload, dict):
-                records.append(payload)
-    return records
-
-
 def _to_issue_bundle_item(issue: Dict[str, Any], source_tool: str | None) -> Dict[str, Any]:
     return {
         "issue_id": issue.get("issue_id"),
@@ -135,7 +128,7 @@ def main() -> None:
     if not args.tool_results.exists():
         raise SystemExit(f"Tool results file not found: {args.tool_results}")
 
-    paragraphs = _read_jsonl(paragraphs_path)
+    paragraphs = read_jsonl(paragraphs_path)
     tool_results_payload = json.loads(args.tool_results.read_text(encoding="utf-8"))
     if not isinstance(tool_results_payload, list):
         raise SystemExit("Tool results payload must be a JSON list.")
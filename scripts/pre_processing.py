@@ -30,6 +30,21 @@ except ImportError:  # pragma: no cover - optional dependency
     Console = None
 
 
+HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s+")
+CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+MARKDOWN_LINE_SUBSTITUTIONS = (
+    (HEADING_RE, ""),
+    (re.compile(r"^\s*>\s?"), ""),
+    (re.compile(r"^\s*[-*+]\s+"), ""),
+    (re.compile(r"^\s*\d+\.\s+"), ""),
+    (re.compile(r"!\[[^\]]*\]\([^\)]*\)"), ""),
+    (re.compile(r"\[([^\]]+)\]\([^\)]*\)"), r"\1"),
+    (re.compile(r"`[^`]+`"), ""),
+    (re.compile(r"[*_]{1,3}"), ""),
+    (re.compile(r"\s+"), " "),
+)
+
+
 @dataclass
 class ParagraphRecord:
     text: str
@@ -46,20 +61,13 @@ def ensure_nltk() -> None:
 
 
 def clean_markdown_line(line: str) -> str:
-    line = re.sub(r"^\s{0,3}#{1,6}\s+", "", line)
-    line = re.sub(r"^\s*>\s?", "", line)
-    line = re.sub(r"^\s*[-*+]\s+", "", line)
-    line = re.sub(r"^\s*\d+\.\s+", "", line)
-    line = re.sub(r"!\[[^\]]*\]\([^\)]*\)", "", line)
-    line = re.sub(r"\[([^\]]+)\]\([^\)]*\)", r"\1", line)
-    line = re.sub(r"`[^`]+`", "", line)
-    line = re.sub(r"[*_]{1,3}", "", line)
-    line = re.sub(r"\s+", " ", line)
+    for pattern, replacement in MARKDOWN_LINE_SUBSTITUTIONS:
+        line = pattern.sub(replacement, line)
     return line.strip()
 
 
 def strip_code_blocks(text: str) -> str:
-    return re.sub(r"```.*?```", "", text, flags=re.DOTALL)
+    return CODE_BLOCK_RE.sub("", text)
 
 
 def parse_paragraphs(raw_text: str) -> List[ParagraphRecord]:
@@ -17,6 +17,7 @@ import re
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
@@ -264,7 +265,7 @@ def build_word_token_index(manuscript_tokens: dict) -> List[dict]:
                     "global_index": token["global_index"],
                 }
             )
-    tokens.sort(key=lambda item: item["global_index"])
+    tokens.sort(key=itemgetter("global_index"))
     return tokens
 
 
@@ -13,6 +13,7 @@ import json
 import time
 from typing import Any
 
+from libs.jsonl import read_jsonl
 from libs.local_llm import (
     DEFAULT_LM_STUDIO_CHAT_COMPLETIONS_URL,
     request_chat_completion_content_streaming,
@@ -135,10 +136,10 @@ def _candidate_prompt_paths(prompt_root: Path, language: str) -> list[Path]:
 def resolve_prompt_path(language: str, prompt_root: Path | None) -> Path:
     roots = [prompt_root] if prompt_root else DEFAULT_PROMPT_ROOTS
     for root in roots:
-        if root is None or not root.exists() or not root.is_dir():
+        if root is None or not root.is_dir():
             continue
         for candidate in _candidate_prompt_paths(root, language):
-            if candidate.exists() and candidate.is_file():
+            if candidate.is_file():
                 return candidate
 
     roots_display = ", ".join(str(r) for r in roots if r is not None)
@@ -150,12 +151,8 @@ def resolve_prompt_path(language: str, prompt_root: Path | None) -> Path:
 
 def _load_paragraphs_from_jsonl(path: Path) -> list[str]:
     paragraphs: list[str] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        row = raw.strip()
-        if not row:
-            continue
-        payload = json.loads(row)
-        if isinstance(payload, dict) and "text" in payload:
+    for payload in read_jsonl(path):
+        if "text" in payload:
             text = str(payload["text"]).strip()
             if text:
                 paragraphs.append(text)
@@ -171,7 +168,7 @@ def load_source_paragraphs(input_path: Path | None, preprocessed: Path | None) -
         elif preprocessed.is_dir():
             preferred = [preprocessed / "paragraphs.jsonl", preprocessed / "lines.jsonl", preprocessed / "sentences.jsonl"]
             for candidate in preferred:
-                if candidate.exists() and candidate.is_file():
+                if candidate.is_file():
                     paragraphs = _load_paragraphs_from_jsonl(candidate)
                     if paragraphs:
                         return paragraphs